@@ -1,9 +1,42 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 try:
     from ._version import version as __version__
 except ImportError:
     __version__ = "unknown"
 
+if TYPE_CHECKING:
+    from .histogram import *  # NoQA
+    from .scatter import *  # NoQA
+    from .slice import *  # NoQA
+
+# Widgets are imported on first access, so that importing napari_matplotlib
+# (e.g. to check the version) doesn't import napari, Qt, and Matplotlib.
+_WIDGET_MODULES = {
+    "HistogramWidget": "histogram",
+    "FeaturesHistogramWidget": "histogram",
+    "ScatterBaseWidget": "scatter",
+    "ScatterWidget": "scatter",
+    "FeaturesScatterWidget": "scatter",
+    "SliceWidget": "slice",
+}
+
+__all__ = list(_WIDGET_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import and return widgets when they are first accessed.
+    """
+    if name in _WIDGET_MODULES:
+        module = importlib.import_module(f".{_WIDGET_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-from .histogram import *  # NoQA
-from .scatter import *  # NoQA
-from .slice import *  # NoQA
+def __dir__() -> list[str]:
+    """
+    List module attributes, including widgets that haven't been imported yet.
+    """
+    return sorted([*globals(), *__all__])
@@ -1,8 +1,12 @@
-import os
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Literal
 
 import matplotlib.style as mplstyle
 import napari
+from matplotlib.artist import Artist
+from matplotlib.backend_bases import DrawEvent
 from matplotlib.backends.backend_qtagg import (  # type: ignore[attr-defined]
     FigureCanvasQTAgg,
     NavigationToolbar2QT,
@@ -10,13 +14,32 @@ from matplotlib.backends.backend_qtagg import (  # type: ignore[attr-defined]
 from matplotlib.figure import Figure
 from napari.utils.events import Event
 from napari.utils.theme import get_theme
-from qtpy.QtGui import QIcon
+from qtpy.QtGui import QCloseEvent, QIcon
 from qtpy.QtWidgets import QLabel, QVBoxLayout, QWidget
+from superqt.utils import qthrottled
 
 from .util import Interval, from_napari_css_get_size_of, style_sheet_from_theme
 
 __all__ = ["BaseNapariMPLWidget", "NapariMPLWidget", "SingleAxesWidget"]
 
+_ICON_ROOT = Path(__file__).parent / "icons"
+# Paths to the toolbar icons, keyed by icon directory and then icon name
+_ICON_PATHS: dict[str, dict[str, str]] = {
+    icon_dir.name: {path.stem: str(path) for path in icon_dir.glob("*.png")}
+    for icon_dir in _ICON_ROOT.iterdir()
+    if icon_dir.is_dir()
+}
+
+
+@lru_cache(maxsize=32)
+def _get_icon(icon_path: str) -> QIcon:
+    """
+    Get the icon stored at ``icon_path``.
+
+    Icons are cached, so each icon file is only read and decoded once.
+    """
+    return QIcon(icon_path)
+
 
 class BaseNapariMPLWidget(QWidget):
     """
@@ -47,14 +70,17 @@ class BaseNapariMPLWidget(QWidget):
 
         # Sets figure.* style
         with mplstyle.context(self.napari_theme_style_sheet):
-            self.canvas = FigureCanvasQTAgg()  # type: ignore[no-untyped-call]
+            self.canvas = FigureCanvasQTAgg(  # type: ignore[no-untyped-call]
+                Figure(layout="constrained")
+            )
 
-        self.canvas.figure.set_layout_engine("constrained")
         self.toolbar = NapariNavigationToolbar(self.canvas, parent=self)
         self._replace_toolbar_icons()
         self.viewer.events.theme.connect(self._on_napari_theme_changed)
 
         self.setLayout(QVBoxLayout())
+        # No margins, so the canvas fills the whole dock widget
+        self.layout().setContentsMargins(0, 0, 0, 0)
         self.layout().addWidget(self.toolbar)
         self.layout().addWidget(self.canvas)
 
@@ -88,6 +114,18 @@ class BaseNapariMPLWidget(QWidget):
         )
         self._replace_toolbar_icons()
 
+    def closeEvent(self, event: QCloseEvent | None) -> None:
+        """
+        Disconnect napari callbacks when the widget is closed.
+
+        Parameters
+        ----------
+        event : qtpy.QtGui.QCloseEvent
+            Event that triggered the callback.
+        """
+        self.viewer.events.theme.disconnect(self._on_napari_theme_changed)
+        super().closeEvent(event)
+
     def _napari_theme_has_light_bg(self) -> bool:
         """
         Does this theme have a light background?
@@ -108,17 +146,27 @@ class BaseNapariMPLWidget(QWidget):
         Icons modified from
         https://github.com/matplotlib/matplotlib/tree/main/lib/matplotlib/mpl-data/images
         """
-        icon_root = Path(__file__).parent / "icons"
         if self._napari_theme_has_light_bg():
-            return icon_root / "black"
+            return _ICON_ROOT / "black"
         else:
-            return icon_root / "white"
+            return _ICON_ROOT / "white"
+
+    def _get_icon_paths(self) -> dict[str, str]:
+        """
+        Get paths to the toolbar icons (which are theme-dependent).
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping from icon name (e.g. ``"Pan"``) to icon file path.
+        """
+        return _ICON_PATHS[self._get_path_to_icon().name]
 
     def _replace_toolbar_icons(self) -> None:
         """
         Modifies toolbar icons to match the napari theme, and add some tooltips.
         """
-        icon_dir = self._get_path_to_icon()
+        icon_paths = self._get_icon_paths()
         for action in self.toolbar.actions():
             text = action.text()
             if text == "Pan":
@@ -131,9 +179,9 @@ class BaseNapariMPLWidget(QWidget):
                     "Zoom to rectangle; Click once to activate; "
                     "Click again to deactivate"
                 )
-            if len(text) > 0:  # i.e. not a separator item
-                icon_path = os.path.join(icon_dir, text + ".png")
-                action.setIcon(QIcon(icon_path))
+            icon_path = icon_paths.get(text)
+            if icon_path is not None:  # i.e. action has a matching icon file
+                action.setIcon(_get_icon(icon_path))
 
 
 class NapariMPLWidget(BaseNapariMPLWidget):
@@ -155,8 +203,8 @@ class NapariMPLWidget(BaseNapariMPLWidget):
     ----------
     viewer : `napari.Viewer`
         Main napari viewer.
-    layers : `list`
-        List of currently selected napari layers.
+    layers : `tuple`
+        Currently selected napari layers.
 
     See Also
     --------
@@ -168,6 +216,10 @@ class NapariMPLWidget(BaseNapariMPLWidget):
     n_layers_input = Interval(None, None)
     #: Type of layer taken as input
     input_layer_types: tuple[napari.layers.Layer, ...] = (napari.layers.Layer,)
+    #: Which changes to the viewer's current step re-draw the figure: any
+    #: change (``"any_step"``), only changes to the z-step (``"z_step"``),
+    #: or none (``"never"``)
+    redraw_on: Literal["any_step", "z_step", "never"] = "any_step"
 
     def __init__(
         self,
@@ -175,8 +227,24 @@ class NapariMPLWidget(BaseNapariMPLWidget):
         parent: QWidget | None = None,
     ):
         super().__init__(napari_viewer=napari_viewer, parent=parent)
+        # Throttled re-draw, used when the z-step changes rapidly
+        self._draw_throttled = qthrottled(self._draw, timeout=100)
         self._setup_callbacks()
-        self.layers: list[napari.layers.Layer] = []
+        self.layers: tuple[napari.layers.Layer, ...] = ()
+        # z-step currently shown in the figure
+        self._drawn_z = self.current_z
+        # Every napari layer is a Layer, so no need to check layer types if
+        # the default input_layer_types is used
+        self._accepts_any_layer = self.input_layer_types == (
+            napari.layers.Layer,
+        )
+        # Cached validity of the layer selection, updated whenever the
+        # selection changes so it doesn't need checking on every re-draw
+        self._valid_layer_selection = self._check_layer_selection()
+        # Figure background (without any blitted artists) used by
+        # _blit_update(), reset whenever the whole canvas is re-drawn
+        self._blit_background: Any = None
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
 
         helper_text = self.n_layers_input._helper_text
         if helper_text is not None:
@@ -215,30 +283,70 @@ class NapariMPLWidget(BaseNapariMPLWidget):
 
         Sets up callbacks for when:
         - Layer selection is changed
-        - z-step is changed
+        - Current step is changed (unless ``redraw_on`` is ``"never"``)
         """
-        # z-step changed in viewer
-        self.viewer.dims.events.current_step.connect(self._draw)
+        # Current step changed in viewer
+        if self.redraw_on != "never":
+            self.viewer.dims.events.current_step.connect(
+                self._on_current_step_changed
+            )
         # Layer selection changed in viewer
         self.viewer.layers.selection.events.changed.connect(
             self._update_layers
         )
 
-    @property
-    def _valid_layer_selection(self) -> bool:
+    def closeEvent(self, event: QCloseEvent | None) -> None:
+        """
+        Disconnect napari callbacks when the widget is closed.
+
+        Parameters
+        ----------
+        event : qtpy.QtGui.QCloseEvent
+            Event that triggered the callback.
         """
-        Return `True` if layer selection is valid.
+        self._draw_throttled.cancel()
+        self.viewer.dims.events.current_step.disconnect(
+            self._on_current_step_changed
+        )
+        self.viewer.layers.selection.events.changed.disconnect(
+            self._update_layers
+        )
+        super().closeEvent(event)
+
+    def _on_current_step_changed(self) -> None:
+        """
+        Schedule a re-draw when the z-step is changed.
+
+        The first change is drawn straight away, and after that the figure
+        is re-drawn at most every 100 ms, so scrubbing through many z-steps
+        does not draw every step.
+        """
+        if self.redraw_on == "z_step" and self.current_z == self._drawn_z:
+            # Nothing to re-draw if a dimension other than z was changed
+            return
+        self._draw_throttled()
+
+    def _check_layer_selection(self) -> bool:
+        """
+        Check the number and type of selected layers are valid for the widget.
         """
-        return self.n_selected_layers in self.n_layers_input and all(
-            isinstance(layer, self.input_layer_types) for layer in self.layers
+        n_layers_valid = self.n_selected_layers in self.n_layers_input
+        return n_layers_valid and (
+            self._accepts_any_layer
+            or all(
+                isinstance(layer, self.input_layer_types)
+                for layer in self.layers
+            )
         )
 
     def _update_layers(self, event: napari.utils.events.Event) -> None:
         """
         Update the ``layers`` attribute with currently selected layers and re-draw.
         """
-        self.layers = list(self.viewer.layers.selection)
-        self.layers = sorted(self.layers, key=lambda layer: layer.name)
+        self.layers = tuple(
+            sorted(self.viewer.layers.selection, key=lambda layer: layer.name)
+        )
+        self._valid_layer_selection = self._check_layer_selection()
         self.on_update_layers()
         if self._valid_layer_selection:
             self._draw()
@@ -248,6 +356,7 @@ class NapariMPLWidget(BaseNapariMPLWidget):
         Clear current figure, check selected layers are correct, and draw new
         figure if so.
         """
+        self._drawn_z = self.current_z
         # Clearing axes sets new defaults, so need to make sure style is applied when
         # this happens
         with mplstyle.context(self.napari_theme_style_sheet):
@@ -255,7 +364,48 @@ class NapariMPLWidget(BaseNapariMPLWidget):
             self.clear()
             if self._valid_layer_selection:
                 self.draw()
+            self.canvas.draw_idle()  # type: ignore[no-untyped-call]
+        # The figure has changed, so the blitting background is out of date
+        # even before the idle draw happens
+        self._blit_background = None
+
+    def _on_canvas_draw(self, event: DrawEvent) -> None:
+        """
+        Invalidate the cached blitting background when the canvas is drawn.
+        """
+        self._blit_background = None
+
+    def _blit_update(self, artists: Sequence[Artist]) -> None:
+        """
+        Re-draw ``artists`` on the canvas, without re-drawing the whole figure.
+
+        This is useful when only a few artists change (e.g. lines being
+        dragged), as it avoids re-drawing all the other artists in the
+        figure. The first call after a full re-draw draws the figure once
+        without ``artists`` to get a background to draw them on to.
+
+        Parameters
+        ----------
+        artists : sequence of matplotlib.artist.Artist
+            Artists to re-draw.
+        """
+        if self._blit_background is None:
+            visible = [artist.get_visible() for artist in artists]
+            for artist in artists:
+                artist.set_visible(False)
             self.canvas.draw()  # type: ignore[no-untyped-call]
+            self._blit_background = self.canvas.copy_from_bbox(  # type: ignore[no-untyped-call]
+                self.figure.bbox
+            )
+            for artist, was_visible in zip(artists, visible, strict=True):
+                artist.set_visible(was_visible)
+
+        self.canvas.restore_region(  # type: ignore[no-untyped-call]
+            self._blit_background
+        )
+        for artist in artists:
+            self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)  # type: ignore[no-untyped-call]
 
     def clear(self) -> None:
         """
@@ -315,24 +465,20 @@ class NapariNavigationToolbar(NavigationToolbar2QT):
     def _update_buttons_checked(self) -> None:
         """Update toggle tool icons when selected/unselected."""
         super()._update_buttons_checked()  # type: ignore[no-untyped-call]
-        icon_dir = self.parentWidget()._get_path_to_icon()
+        icon_paths = self.parentWidget()._get_icon_paths()
 
         # changes pan/zoom icons depending on state (checked or not)
         if "pan" in self._actions:
             if self._actions["pan"].isChecked():
                 self._actions["pan"].setIcon(
-                    QIcon(os.path.join(icon_dir, "Pan_checked.png"))
+                    _get_icon(icon_paths["Pan_checked"])
                 )
             else:
-                self._actions["pan"].setIcon(
-                    QIcon(os.path.join(icon_dir, "Pan.png"))
-                )
+                self._actions["pan"].setIcon(_get_icon(icon_paths["Pan"]))
         if "zoom" in self._actions:
             if self._actions["zoom"].isChecked():
                 self._actions["zoom"].setIcon(
-                    QIcon(os.path.join(icon_dir, "Zoom_checked.png"))
+                    _get_icon(icon_paths["Zoom_checked"])
                 )
             else:
-                self._actions["zoom"].setIcon(
-                    QIcon(os.path.join(icon_dir, "Zoom.png"))
-                )
+                self._actions["zoom"].setIcon(_get_icon(icon_paths["Zoom"]))
@@ -4,8 +4,10 @@ import napari
 import numpy as np
 import numpy.typing as npt
 from matplotlib.container import BarContainer
+from matplotlib.lines import Line2D
 from napari.layers import Image
 from napari.layers._multiscale_data import MultiScaleData
+from qtpy.QtGui import QCloseEvent
 from qtpy.QtWidgets import (
     QComboBox,
     QFormLayout,
@@ -15,6 +17,7 @@ from qtpy.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from superqt.utils import signals_blocked
 
 from .base import SingleAxesWidget
 from .features import FEATURES_LAYER_TYPES
@@ -60,6 +63,7 @@ class HistogramWidget(SingleAxesWidget):
 
     n_layers_input = Interval(1, 1)
     input_layer_types = (napari.layers.Image,)
+    redraw_on = "z_step"
 
     def __init__(
         self,
@@ -67,6 +71,8 @@ class HistogramWidget(SingleAxesWidget):
         parent: QWidget | None = None,
     ):
         super().__init__(napari_viewer, parent=parent)
+        # Layer that _update_contrast_lims is connected to
+        self._contrast_layer: Image | None = None
 
         num_bins_widget = QSpinBox()
         num_bins_widget.setRange(1, 100_000)
@@ -99,25 +105,57 @@ class HistogramWidget(SingleAxesWidget):
         Called when the selected layers are updated.
         """
         super().on_update_layers()
-        if self._valid_layer_selection:
-            self.layers[0].events.contrast_limits.connect(
-                self._update_contrast_lims
-            )
-
-        if not self.layers:
+        self._disconnect_contrast_layer()
+        if not self._valid_layer_selection:
             return
 
+        self._contrast_layer = self.layers[0]
+        self._contrast_layer.events.contrast_limits.connect(
+            self._update_contrast_lims
+        )
+
         # Reset the num bins based on new layer data
         layer_data = self._get_layer_data(self.layers[0])
         self._set_widget_nums_bins(data=layer_data)
 
+    def closeEvent(self, event: QCloseEvent | None) -> None:
+        """
+        Disconnect napari callbacks when the widget is closed.
+
+        Parameters
+        ----------
+        event : qtpy.QtGui.QCloseEvent
+            Event that triggered the callback.
+        """
+        self._disconnect_contrast_layer()
+        super().closeEvent(event)
+
+    def _disconnect_contrast_layer(self) -> None:
+        """
+        Stop updating the contrast limit lines when the contrast limits change.
+        """
+        if self._contrast_layer is not None:
+            self._contrast_layer.events.contrast_limits.disconnect(
+                self._update_contrast_lims
+            )
+            self._contrast_layer = None
+
+    def clear(self) -> None:
+        """
+        Clear the axes, and forget the contrast limit lines drawn on them.
+        """
+        super().clear()
+        self._contrast_lines: list[Line2D] = []
+
     def _update_contrast_lims(self) -> None:
         for lim, line in zip(
             self.layers[0].contrast_limits, self._contrast_lines, strict=False
         ):
-            line.set_xdata(lim)
+            line.set_xdata([lim, lim])
 
-        self.figure.canvas.draw()
+        # Only the contrast limit lines have changed, so blit them to avoid
+        # re-drawing the whole histogram
+        self._blit_update(self._contrast_lines)
 
     def _set_widget_nums_bins(self, data: npt.NDArray[Any]) -> None:
         """Update num_bins widget with bins determined from the image data"""
@@ -184,6 +222,8 @@ class FeaturesHistogramWidget(SingleAxesWidget):
     n_layers_input = Interval(1, 1)
     # All layers that have a .features attributes
     input_layer_types = FEATURES_LAYER_TYPES
+    # Features don't change with the z-step
+    redraw_on = "never"
 
     def __init__(
         self,
@@ -264,24 +304,35 @@ class FeaturesHistogramWidget(SingleAxesWidget):
         """
         Called when the layer selection changes by ``self.update_layers()``.
         """
-        # reset the axis keys
-        self._x_axis_key = None
+        # Block signals while updating the combo box, so the plot isn't
+        # re-drawn on every change. It's re-drawn once by _update_layers().
+        with signals_blocked(self._key_selection_widget):
+            # Clear combobox
+            self._key_selection_widget.clear()
+            self._key_selection_widget.addItems(self._get_valid_axis_keys())
+
+        # reset the axis key to the first key for the new layer
+        self._x_axis_key = self._key_selection_widget.currentText() or None
 
-        # Clear combobox
-        self._key_selection_widget.clear()
-        self._key_selection_widget.addItems(self._get_valid_axis_keys())
+        if not self._valid_layer_selection:
+            # _update_layers() only re-draws a valid selection, so make sure
+            # the plot for the previous selection is cleared
+            self._draw()
 
     def draw(self) -> None:
         """Clear the axes and histogram the currently selected layer/slice."""
+        if not self.x_axis_key:
+            # No feature selected, so skip re-colouring and refreshing the
+            # layer, as there's nothing to plot
+            return
+
         # get the colormap from the layer depending on its type
         if isinstance(self.layers[0], napari.layers.Points):
             colormap = self.layers[0].face_colormap
-            if self.x_axis_key:
-                self.layers[0].face_color = self.x_axis_key
+            self.layers[0].face_color = self.x_axis_key
         elif isinstance(self.layers[0], napari.layers.Vectors):
             colormap = self.layers[0].edge_colormap
-            if self.x_axis_key:
-                self.layers[0].edge_color = self.x_axis_key
+            self.layers[0].edge_color = self.x_axis_key
         else:
             colormap = None
 
@@ -3,6 +3,7 @@ from typing import Any
 import napari
 import numpy.typing as npt
 from qtpy.QtWidgets import QComboBox, QLabel, QVBoxLayout, QWidget
+from superqt.utils import signals_blocked
 
 from .base import SingleAxesWidget
 from .features import FEATURES_LAYER_TYPES
@@ -66,6 +67,7 @@ class ScatterWidget(ScatterBaseWidget):
 
     n_layers_input = Interval(2, 2)
     input_layer_types = (napari.layers.Image,)
+    redraw_on = "z_step"
 
     def _get_data(self) -> tuple[npt.NDArray[Any], npt.NDArray[Any], str, str]:
         """
@@ -96,6 +98,8 @@ class FeaturesScatterWidget(ScatterBaseWidget):
     n_layers_input = Interval(1, 1)
     # All layers that have a .features attributes
     input_layer_types = FEATURES_LAYER_TYPES
+    # Features don't change with the z-step
+    redraw_on = "never"
 
     def __init__(
         self,
@@ -129,8 +133,8 @@ class FeaturesScatterWidget(ScatterBaseWidget):
 
     @x_axis_key.setter
     def x_axis_key(self, key: str) -> None:
+        # Changing the selector text triggers a re-draw
         self._selectors["x"].setCurrentText(key)
-        self._draw()
 
     @property
     def y_axis_key(self) -> str | None:
@@ -144,8 +148,8 @@ class FeaturesScatterWidget(ScatterBaseWidget):
 
     @y_axis_key.setter
     def y_axis_key(self, key: str) -> None:
+        # Changing the selector text triggers a re-draw
         self._selectors["y"].setCurrentText(key)
-        self._draw()
 
     def _get_valid_axis_keys(self) -> list[str]:
         """
@@ -217,9 +221,16 @@ class FeaturesScatterWidget(ScatterBaseWidget):
         """
         Called when the layer selection changes by ``self.update_layers()``.
         """
-        # Clear combobox
+        # Block signals while updating the combo boxes, so the plot isn't
+        # re-drawn on every change. It's re-drawn once by _update_layers().
         for dim in ["x", "y"]:
-            while self._selectors[dim].count() > 0:
-                self._selectors[dim].removeItem(0)
-            # Add keys for newly selected layer
-            self._selectors[dim].addItems(self._get_valid_axis_keys())
+            with signals_blocked(self._selectors[dim]):
+                # Clear combobox
+                self._selectors[dim].clear()
+                # Add keys for newly selected layer
+                self._selectors[dim].addItems(self._get_valid_axis_keys())
+
+        if not self._valid_layer_selection:
+            # _update_layers() only re-draws a valid selection, so make sure
+            # the plot for the previous selection is cleared
+            self._draw()
@@ -26,6 +26,7 @@ class SliceWidget(SingleAxesWidget):
 
     n_layers_input = Interval(1, 1)
     input_layer_types = (napari.layers.Image,)
+    redraw_on = "z_step"
 
     def __init__(
         self,
@@ -152,3 +152,90 @@ def test_change_layer(make_napari_viewer, brain_data, astronaut_data):
     viewer.layers.selection.clear()
     viewer.layers.selection.add(viewer.layers[1])
     assert_figures_not_equal(widget.figure, fig1)
+
+
+def test_contrast_callback_disconnected_on_close(
+    make_napari_viewer, brain_data, astronaut_data
+):
+    viewer = make_napari_viewer()
+    layer_a = viewer.add_image(brain_data[0], **brain_data[1])
+    layer_b = viewer.add_image(astronaut_data[0], **astronaut_data[1])
+    n_callbacks_a = len(layer_a.events.contrast_limits.callbacks)
+    n_callbacks_b = len(layer_b.events.contrast_limits.callbacks)
+
+    widget = HistogramWidget(viewer)
+    viewer.layers.selection.clear()
+    viewer.layers.selection.add(layer_a)
+    assert len(layer_a.events.contrast_limits.callbacks) == n_callbacks_a + 1
+
+    # Switching layers should only listen to the newly selected layer
+    viewer.layers.selection.clear()
+    viewer.layers.selection.add(layer_b)
+    assert len(layer_a.events.contrast_limits.callbacks) == n_callbacks_a
+    assert len(layer_b.events.contrast_limits.callbacks) == n_callbacks_b + 1
+
+    widget.close()
+    assert len(layer_a.events.contrast_limits.callbacks) == n_callbacks_a
+    assert len(layer_b.events.contrast_limits.callbacks) == n_callbacks_b
+
+
+def test_contrast_lines_blitted(make_napari_viewer, astronaut_data):
+    viewer = make_napari_viewer()
+    layer = viewer.add_image(astronaut_data[0], **astronaut_data[1])
+    widget = HistogramWidget(viewer)
+
+    layer.contrast_limits = (10, 200)
+    np.testing.assert_equal(
+        [line.get_xdata() for line in widget._contrast_lines],
+        [[10, 10], [200, 200]],
+    )
+    background = widget._blit_background
+    assert background is not None
+
+    # Only the lines have moved, so the background should be re-used
+    layer.contrast_limits = (20, 100)
+    np.testing.assert_equal(
+        [line.get_xdata() for line in widget._contrast_lines],
+        [[20, 20], [100, 100]],
+    )
+    assert widget._blit_background is background
+
+
+def test_close_with_labels_selected(make_napari_viewer):
+    viewer = make_napari_viewer()
+    viewer.add_labels(np.zeros((10, 10), dtype=int))
+    widget = HistogramWidget(viewer)
+    widget.close()
+
+
+def test_contrast_lines_reset_on_clear(
+    make_napari_viewer, brain_data, astronaut_data
+):
+    viewer = make_napari_viewer()
+    widget = HistogramWidget(viewer)
+    viewer.add_image(brain_data[0], **brain_data[1])
+    viewer.add_image(astronaut_data[0], **astronaut_data[1])
+
+    viewer.layers.selection.clear()
+    viewer.layers.selection.add(viewer.layers[0])
+    assert len(widget._contrast_lines) == 2
+
+    # An invalid selection followed by a re-draw clears the axes without
+    # drawing new contrast lines, so none should be left to blit
+    viewer.layers.selection.add(viewer.layers[1])
+    viewer.theme = "light"
+    assert widget._contrast_lines == []
+
+
+def test_blit_background_reset_on_draw(make_napari_viewer, astronaut_data):
+    viewer = make_napari_viewer()
+    viewer.add_image(astronaut_data[0], **astronaut_data[1])
+    widget = HistogramWidget(viewer)
+
+    widget._blit_update(widget._contrast_lines)
+    assert widget._blit_background is not None
+
+    # Re-drawing the histogram should invalidate the background straight away,
+    # not only once the idle draw has happened
+    widget.num_bins_widget.setValue(5)
+    assert widget._blit_background is None
@@ -2,7 +2,14 @@ import pytest
 from qtpy.QtCore import QSize
 from qtpy.QtGui import QImage
 
-from napari_matplotlib import HistogramWidget, ScatterWidget, SliceWidget
+from napari_matplotlib import (
+    FeaturesHistogramWidget,
+    FeaturesScatterWidget,
+    HistogramWidget,
+    ScatterWidget,
+    SliceWidget,
+)
+from napari_matplotlib.base import NapariMPLWidget, SingleAxesWidget
 
 
 def _are_different(a: QImage, b: QImage) -> bool:
@@ -47,3 +54,101 @@ def test_mpl_toolbar_buttons_checked(make_napari_viewer, Widget):
             assert action.isChecked() is True
             checked = action.icon().pixmap(QSize(48, 48)).toImage()
             assert _are_different(unchecked, checked)
+
+
+def test_callbacks_disconnected_on_close(make_napari_viewer):
+    """Test that napari callbacks are removed when a widget is closed."""
+    viewer = make_napari_viewer()
+    events = [
+        viewer.events.theme,
+        viewer.dims.events.current_step,
+        viewer.layers.selection.events.changed,
+    ]
+    n_callbacks = [len(event.callbacks) for event in events]
+
+    widget = SliceWidget(viewer)
+    assert [len(event.callbacks) for event in events] != n_callbacks
+
+    widget.close()
+    assert [len(event.callbacks) for event in events] == n_callbacks
+
+
+def test_blit_update(make_napari_viewer):
+    """Test blitting artists, and that full re-draws reset the background."""
+    viewer = make_napari_viewer()
+    widget = SliceWidget(viewer)
+    line = widget.axes.axvline(0.5)
+
+    widget._blit_update([line])
+    background = widget._blit_background
+    assert background is not None
+    assert line.get_visible()
+
+    # The background should be re-used until the whole canvas is re-drawn
+    line.set_xdata([0.25])
+    widget._blit_update([line])
+    assert widget._blit_background is background
+
+    widget.canvas.draw()  # type: ignore[no-untyped-call]
+    assert widget._blit_background is None
+
+
+def test_blit_update_keeps_hidden_artists_hidden(make_napari_viewer):
+    """Test blitting doesn't show artists that were hidden."""
+    viewer = make_napari_viewer()
+    widget = SliceWidget(viewer)
+    line = widget.axes.axvline(0.5, visible=False)
+
+    widget._blit_update([line])
+    assert not line.get_visible()
+
+
+def test_redraw_only_on_z_change(make_napari_viewer, mocker):
+    """Test that only z-step changes schedule a re-draw."""
+    viewer = make_napari_viewer()
+    viewer.dims.ndim = 3
+    viewer.dims.range = [(0, 10, 1)] * 3
+    widget = SliceWidget(viewer)
+    draw = mocker.patch.object(widget, "_draw_throttled")
+
+    viewer.dims.set_current_step(1, 3)
+    draw.assert_not_called()
+
+    viewer.dims.set_current_step(0, 3)
+    draw.assert_called_once()
+
+
+def test_redraw_on_any_dim_change_by_default(make_napari_viewer, mocker):
+    """Test that widgets re-draw on any current_step change by default."""
+    viewer = make_napari_viewer()
+    viewer.dims.ndim = 3
+    viewer.dims.range = [(0, 10, 1)] * 3
+    widget = NapariMPLWidget(viewer)
+    draw = mocker.patch.object(widget, "_draw_throttled")
+
+    viewer.dims.set_current_step(1, 3)
+    draw.assert_called_once()
+
+
+def test_draw_with_no_layers_selected(make_napari_viewer, mocker):
+    """Test widgets accepting any number of layers draw with none selected."""
+    viewer = make_napari_viewer()
+    viewer.dims.ndim = 3
+    viewer.dims.range = [(0, 10, 1)] * 3
+    widget = SingleAxesWidget(viewer)
+    draw = mocker.patch.object(widget, "draw")
+
+    viewer.dims.set_current_step(0, 3)
+    viewer.theme = "light"
+    assert draw.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "Widget", [FeaturesHistogramWidget, FeaturesScatterWidget]
+)
+def test_features_widgets_ignore_z_step(make_napari_viewer, Widget):
+    """Test that widgets plotting features don't listen to z-step changes."""
+    viewer = make_napari_viewer()
+    n_callbacks = len(viewer.dims.events.current_step.callbacks)
+    Widget(viewer)
+    assert len(viewer.dims.events.current_step.callbacks) == n_callbacks
@@ -1,5 +1,8 @@
 import importlib
+import os
+import subprocess
 import sys
+from pathlib import Path
 
 import pytest
 from qtpy.QtCore import QSize
@@ -17,6 +20,51 @@ def test_version_fallback(mocker):
     assert napari_matplotlib.__version__ == "unknown"  # type: ignore[attr-defined]
 
 
+def test_lazy_widget_import():
+    """Test widgets can be accessed from the top level package"""
+    import napari_matplotlib  # fmt: skip
+    from napari_matplotlib.histogram import HistogramWidget
+
+    assert napari_matplotlib.HistogramWidget is HistogramWidget
+    assert "HistogramWidget" in dir(napari_matplotlib)
+    with pytest.raises(AttributeError, match="has no attribute 'NotAWidget'"):
+        _ = napari_matplotlib.NotAWidget
+
+
+def test_lazy_widget_table_matches_submodules():
+    """Test the lazy import table lists every widget in the submodules"""
+    import napari_matplotlib  # fmt: skip
+    from napari_matplotlib import histogram, scatter, slice
+
+    submodule_widgets = {
+        name: module.__name__.rsplit(".", 1)[-1]
+        for module in (histogram, scatter, slice)
+        for name in module.__all__
+    }
+    assert napari_matplotlib._WIDGET_MODULES == submodule_widgets
+
+
+def test_import_does_not_import_widget_dependencies():
+    """Test importing the package doesn't import napari, Qt, or Matplotlib"""
+    import napari_matplotlib  # fmt: skip
+
+    # Make sure the subprocess imports the same copy of the package
+    package_root = str(Path(napari_matplotlib.__file__).parents[1])
+    env = {**os.environ, "PYTHONPATH": package_root}
+    code = (
+        "import sys, napari_matplotlib; "
+        "print(sorted({'napari', 'qtpy', 'matplotlib'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
 def test_interval():
     interval = Interval(4, 9)
     for i in range(4, 10):